@@ -25,27 +25,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN][entry.entry_id] = {
             "client": client,
         }
+
+        # Open the session now so the first request doesn't pay for the
+        # WebSocket handshake
+        client.async_schedule_connect()
         
-        # Load TTS and STT platforms with discovery info
-        hass.async_create_task(
-            async_load_platform(
-                hass,
-                Platform.TTS,
-                DOMAIN,
-                {"entry_id": entry.entry_id},
-                hass.data[Platform.TTS],
-            )
-        )
-        
-        hass.async_create_task(
-            async_load_platform(
-                hass,
-                Platform.STT,
-                DOMAIN,
-                {"entry_id": entry.entry_id},
-                hass.data[Platform.STT],
+        # Load TTS and STT platforms with discovery info. Eager start runs
+        # each load up to its first real await without a loop round-trip.
+        for platform in (Platform.TTS, Platform.STT):
+            hass.async_create_task(
+                async_load_platform(
+                    hass,
+                    platform,
+                    DOMAIN,
+                    {"entry_id": entry.entry_id},
+                    hass.data[platform],
+                ),
+                eager_start=True,
             )
-        )
         
         return True
         
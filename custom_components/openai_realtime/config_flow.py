@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -22,12 +23,46 @@ from .const import (
     DEFAULT_VOICE,
     DOMAIN,
     SUPPORTED_LANGUAGES,
-    SUPPORTED_MODELS,
-    SUPPORTED_VOICES,
+    SUPPORTED_MODEL_OPTIONS,
+    SUPPORTED_VOICE_OPTIONS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+API_KEY_PATTERN = re.compile(r"sk-\S+")
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_API_KEY): str,
+        vol.Optional(CONF_MODEL, default=DEFAULT_MODEL): vol.In(
+            SUPPORTED_MODEL_OPTIONS
+        ),
+        vol.Optional(CONF_VOICE, default=DEFAULT_VOICE): vol.In(
+            SUPPORTED_VOICE_OPTIONS
+        ),
+        vol.Optional(CONF_INSTRUCTIONS, default=DEFAULT_INSTRUCTIONS): str,
+        vol.Optional(CONF_LANGUAGE, default=DEFAULT_LANGUAGE): vol.In(
+            SUPPORTED_LANGUAGES
+        ),
+    }
+)
+
+# Current values are filled in per form via add_suggested_values_to_schema
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MODEL, default=DEFAULT_MODEL): vol.In(
+            SUPPORTED_MODEL_OPTIONS
+        ),
+        vol.Optional(CONF_VOICE, default=DEFAULT_VOICE): vol.In(
+            SUPPORTED_VOICE_OPTIONS
+        ),
+        vol.Optional(CONF_INSTRUCTIONS, default=DEFAULT_INSTRUCTIONS): str,
+        vol.Optional(CONF_LANGUAGE, default=DEFAULT_LANGUAGE): vol.In(
+            SUPPORTED_LANGUAGES
+        ),
+    }
+)
+
 
 class OpenAIRealtimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for OpenAI Realtime."""
@@ -43,7 +78,7 @@ class OpenAIRealtimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Validate API key format (basic check)
             api_key = user_input[CONF_API_KEY]
-            if not api_key or not api_key.startswith("sk-"):
+            if not api_key or not API_KEY_PATTERN.fullmatch(api_key):
                 errors[CONF_API_KEY] = "invalid_api_key"
             else:
                 # Create the entry
@@ -61,27 +96,8 @@ class OpenAIRealtimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
 
         # Show the form
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_API_KEY): str,
-                vol.Optional(CONF_MODEL, default=DEFAULT_MODEL): vol.In(
-                    SUPPORTED_MODELS
-                ),
-                vol.Optional(CONF_VOICE, default=DEFAULT_VOICE): vol.In(
-                    SUPPORTED_VOICES
-                ),
-                
-                vol.Optional(
-                    CONF_INSTRUCTIONS, default=DEFAULT_INSTRUCTIONS
-                ): str,
-                vol.Optional(CONF_LANGUAGE, default=DEFAULT_LANGUAGE): vol.In(
-                    SUPPORTED_LANGUAGES
-                ),
-            }
-        )
-
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=errors
+            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
     @staticmethod
@@ -108,29 +124,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        # Get current options with defaults
-        current_options = self.config_entry.options
-        
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_MODEL,
-                    default=current_options.get(CONF_MODEL, DEFAULT_MODEL),
-                ): vol.In(SUPPORTED_MODELS),
-                vol.Optional(
-                    CONF_VOICE,
-                    default=current_options.get(CONF_VOICE, DEFAULT_VOICE),
-                ): vol.In(SUPPORTED_VOICES),
-                
-                vol.Optional(
-                    CONF_INSTRUCTIONS,
-                    default=current_options.get(CONF_INSTRUCTIONS, DEFAULT_INSTRUCTIONS),
-                ): str,
-                vol.Optional(
-                    CONF_LANGUAGE,
-                    default=current_options.get(CONF_LANGUAGE, DEFAULT_LANGUAGE),
-                ): vol.In(SUPPORTED_LANGUAGES),
-            }
+        # Pre-fill the form with the current options
+        data_schema = self.add_suggested_values_to_schema(
+            OPTIONS_SCHEMA, self.config_entry.options
         )
 
         return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -39,6 +39,11 @@ SUPPORTED_VOICES = [
     "verse",
 ]
 
+# Value -> label mappings for vol.In: dict lookups are O(1) and, unlike a
+# frozenset, keep the list order when the form is rendered
+SUPPORTED_MODEL_OPTIONS = {model: model for model in SUPPORTED_MODELS}
+SUPPORTED_VOICE_OPTIONS = {voice: voice for voice in SUPPORTED_VOICES}
+
 SUPPORTED_LANGUAGES = {
     "en": "English",
     "fr": "Français",
@@ -67,8 +72,28 @@ API_MODEL_PARAM = "model"
 AUDIO_FORMAT = "pcm16"
 AUDIO_SAMPLE_RATE = 24000
 AUDIO_CHANNELS = 1
+AUDIO_SAMPLE_WIDTH = 2  # bytes per PCM16 sample
+# Microphone chunks are coalesced and sent at most this often (seconds)
+AUDIO_SEND_INTERVAL = 0.08
+# Payloads at least this large (bytes) are base64 encoded/decoded in the
+# executor; below it the hop costs more than the C-accelerated codec
+AUDIO_EXECUTOR_THRESHOLD = 16384
+
+# Maximum time to wait for the session to be ready (seconds)
+CONNECT_TIMEOUT = 10.0
+# Maximum time to wait for a complete response (seconds)
+RESPONSE_TIMEOUT = 30.0
+# Maximum time to wait for a cancelled response to end (seconds)
+CANCEL_TIMEOUT = 5.0
+# Maximum number of items buffered per STT/TTS request, and the fill level
+# at which a warning is logged
+RESPONSE_QUEUE_SIZE = 256
+RESPONSE_QUEUE_WARN_SIZE = RESPONSE_QUEUE_SIZE * 3 // 4
 
 # Session Configuration
+# Sent once per connection and never changed per turn: audio output also
+# carries the transcript, so it serves both STT and TTS requests
+SESSION_OUTPUT_MODALITIES = ["audio"]
 SESSION_TURN_DETECTION_TYPE = "server_vad"
 SESSION_TURN_DETECTION_THRESHOLD = 0.5
 SESSION_TURN_DETECTION_PREFIX_PADDING_MS = 300
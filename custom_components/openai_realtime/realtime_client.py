@@ -3,20 +3,24 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
 import logging
-from typing import Any, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from enum import IntFlag
+from typing import Any
 
-import websockets
-from websockets.client import WebSocketClientProtocol
+import orjson
+from websockets.asyncio.client import ClientConnection, connect as ws_connect
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.ssl import get_default_context
 
 from .const import (
+    AUDIO_EXECUTOR_THRESHOLD,
     AUDIO_FORMAT,
     AUDIO_SAMPLE_RATE,
+    AUDIO_SEND_INTERVAL,
     CONF_INSTRUCTIONS,
     CONF_MODEL,
     CONF_MODALITIES,
@@ -37,15 +41,49 @@ from .const import (
     EVENT_TYPE_SESSION_UPDATE,
     EVENT_TYPE_INPUT_AUDIO_BUFFER_SPEECH_STARTED,
     EVENT_TYPE_INPUT_AUDIO_BUFFER_SPEECH_STOPPED,
+    EVENT_ERROR,
     EVENT_RESPONSE_CREATED,
     OPENAI_REALTIME_URL,
+    SESSION_OUTPUT_MODALITIES,
     VAD_PREFIX_PADDING_MS,
     VAD_SILENCE_DURATION_MS,
     VAD_THRESHOLD,
 )
+from .exceptions import ConnectionError as RealtimeConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Audio append events are sent for every microphone chunk, so their JSON is
+# assembled around the base64 payload instead of going through a dict.
+_AUDIO_APPEND_PREFIX = (
+    b'{"type":"' + EVENT_TYPE_INPUT_AUDIO_BUFFER_APPEND.encode() + b'","audio":"'
+)
+_AUDIO_APPEND_SUFFIX = b'"}'
+
+# Control events without a payload never change, so serialize them once
+_MSG_COMMIT = orjson.dumps({"type": EVENT_TYPE_INPUT_AUDIO_BUFFER_COMMIT})
+_MSG_CLEAR = orjson.dumps({"type": EVENT_TYPE_INPUT_AUDIO_BUFFER_CLEAR})
+_MSG_CANCEL = orjson.dumps({"type": EVENT_TYPE_RESPONSE_CANCEL})
+_MSG_RESPONSE_CREATE = orjson.dumps({"type": EVENT_TYPE_RESPONSE_CREATE})
+
+# User text messages are serialized the same way around the escaped text
+_TEXT_ITEM_PREFIX = (
+    b'{"type":"' + EVENT_TYPE_CONVERSATION_ITEM_CREATE.encode() + b'",'
+    b'"item":{"type":"message","role":"user",'
+    b'"content":[{"type":"input_text","text":'
+)
+_TEXT_ITEM_SUFFIX = b"}]}}"
+
+_AUDIO_DELTA_MARKER = f'"{EVENT_TYPE_RESPONSE_AUDIO_DELTA}"'
+
+
+class _State(IntFlag):
+    """Connection and conversation state flags."""
+
+    CONNECTED = 1
+    SPEAKING = 2
+    ACTIVE_RESPONSE = 4
+
 
 class OpenAIRealtimeClient:
     """Client for OpenAI Realtime API."""
@@ -54,28 +92,67 @@ class OpenAIRealtimeClient:
         """Initialize the client."""
         self.hass = hass
         self.config_entry = config_entry
-        self._ws: WebSocketClientProtocol | None = None
-        self._connected = False
+        self._ws: ClientConnection | None = None
+        self._state = _State(0)
         self._receive_task: asyncio.Task | None = None
-        self._audio_callback: Callable[[bytes], None] | None = None
-        self._transcript_callback: Callable[[str], None] | None = None
-        self._response_done_callback: Callable[[], None] | None = None
+        self._dispatch_task: asyncio.Task | None = None
+        self._connect_task: asyncio.Task | None = None
+        # Set once the WebSocket is open and the session is configured
+        self.ready = asyncio.Event()
+        # Response events carry nothing that ties them to the request that
+        # caused them, so a request holds this from sending its input until
+        # its response is done
+        self.request_lock = asyncio.Lock()
+        # Received messages waiting to be handled; bounded so a slow handler
+        # pushes back on the socket instead of growing memory
+        self._msg_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=64)
+        # Listeners are registered per request and receive every event, so a
+        # request must hold request_lock while its listeners are registered.
+        # They are always called from the event loop (the dispatch task), so
+        # they may touch asyncio objects directly.
+        self._audio_listeners: list[Callable[[bytes], None]] = []
+        self._transcript_listeners: list[Callable[[str], None]] = []
+        self._response_done_listeners: list[Callable[[], None]] = []
         self._speech_started_callback: Callable[[], None] | None = None
         self._speech_stopped_callback: Callable[[], None] | None = None
         
-        # Audio buffer for incoming audio
-        self._audio_buffer: list[bytes] = []
-        self._is_speaking = False
-        self._has_active_response = False
+        # Outgoing microphone audio waiting to be flushed in a single event
+        self._pending_audio = bytearray()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Keeps append events in order while a flush encodes in the executor
+        self._flush_lock = asyncio.Lock()
+
+        # Serialized session.update and the options it was built from
+        self._session_payload: bytes | None = None
+        self._session_options: dict[str, Any] | None = None
+
+        # Incoming event handlers, keyed by event type
+        self._handlers: dict[str, Callable[[dict[str, Any]], Awaitable[None]]] = {
+            EVENT_TYPE_RESPONSE_AUDIO_DELTA: self._on_audio_delta,
+            EVENT_TYPE_RESPONSE_AUDIO_TRANSCRIPT_DELTA: self._on_transcript_delta,
+            EVENT_TYPE_RESPONSE_DONE: self._on_response_done,
+            EVENT_RESPONSE_CREATED: self._on_response_created,
+            EVENT_TYPE_INPUT_AUDIO_BUFFER_SPEECH_STARTED: self._on_speech_started,
+            EVENT_TYPE_INPUT_AUDIO_BUFFER_SPEECH_STOPPED: self._on_speech_stopped,
+            EVENT_ERROR: self._on_error,
+        }
+        # Quoted event types we handle. Messages that contain none of them
+        # (content parts, output items, ...) are dropped before queueing.
+        self._event_markers = tuple(f'"{event_type}"' for event_type in self._handlers)
 
     @property
     def connected(self) -> bool:
         """Return if connected."""
-        return self._connected and self._ws is not None
+        return bool(self._state & _State.CONNECTED) and self._ws is not None
+
+    @property
+    def is_ready(self) -> bool:
+        """Return if the session is configured and still connected."""
+        return self.ready.is_set() and self.connected
 
     async def connect(self) -> None:
         """Connect to OpenAI Realtime API."""
-        if self._connected:
+        if self._state & _State.CONNECTED:
             return
 
         api_key = self.config_entry.data[CONF_API_KEY]
@@ -87,54 +164,153 @@ class OpenAIRealtimeClient:
             "Authorization": f"Bearer {api_key}",
         }
 
+        # A dropped connection leaves its tasks and socket behind; stop them
+        # before the new ones replace the references
+        self.ready.clear()
+        await self._close_connection()
+
         try:
             _LOGGER.debug("Connecting to OpenAI Realtime API: %s", url)
-            self._ws = await websockets.connect(url, additional_headers=headers)
-            self._connected = True
+            self._ws = await ws_connect(
+                url,
+                additional_headers=headers,
+                # Home Assistant's shared SSL context, so every connect and
+                # config entry reuses the loaded CA bundle
+                ssl=get_default_context(),
+                # Base64 audio is effectively incompressible, so
+                # permessage-deflate would only burn CPU on every frame
+                compression=None,
+                max_size=2**20,
+                # Bound the frames buffered ahead of the receive loop
+                max_queue=32,
+                ping_interval=20,
+                ping_timeout=20,
+                write_limit=2**20,
+            )
+            # A new session starts with no response in flight
+            self._state = _State.CONNECTED
             _LOGGER.info("Connected to OpenAI Realtime API")
 
-            # Start receiving messages
+            # Start receiving and handling messages
+            self._msg_queue = asyncio.Queue(maxsize=64)
             self._receive_task = asyncio.create_task(self._receive_messages())
+            self._dispatch_task = asyncio.create_task(self._dispatch_messages())
 
             # Configure session
             await self._configure_session()
 
+            # _send_raw only logs a failed send, so the server may have closed
+            # the socket meanwhile; never report a dead session as ready
+            if not self._state & _State.CONNECTED or self._receive_task.done():
+                raise RealtimeConnectionError(
+                    "Connection closed while configuring the session"
+                )
+            self.ready.set()
+
         except Exception as err:
             _LOGGER.error("Failed to connect to OpenAI Realtime API: %s", err)
-            self._connected = False
+            self._state &= ~_State.CONNECTED
             raise
 
-    async def disconnect(self) -> None:
-        """Disconnect from OpenAI Realtime API."""
-        if not self._connected:
+    @callback
+    def async_schedule_connect(self) -> None:
+        """Start connecting in the background unless connected or connecting."""
+        if self.is_ready or (
+            self._connect_task is not None and not self._connect_task.done()
+        ):
             return
 
-        self._connected = False
+        self._connect_task = self.hass.async_create_background_task(
+            self._async_connect_background(), "openai_realtime connect"
+        )
 
-        if self._receive_task:
-            self._receive_task.cancel()
+    async def _async_connect_background(self) -> None:
+        """Connect, leaving failures to whoever waits for the session."""
+        try:
+            await self.connect()
+        except Exception:
+            # connect() already logged the error
+            pass
+
+    async def async_wait_ready(self, timeout: float) -> None:
+        """Wait until the session is ready, connecting first if needed."""
+        if self.is_ready:
+            return
+
+        self.async_schedule_connect()
+        if self._connect_task is not None:
+            async with asyncio.timeout(timeout):
+                await asyncio.shield(self._connect_task)
+
+        if not self.is_ready:
+            raise RealtimeConnectionError("OpenAI Realtime session is not ready")
+
+    async def disconnect(self) -> None:
+        """Disconnect from OpenAI Realtime API."""
+        if self._connect_task is not None and not self._connect_task.done():
+            self._connect_task.cancel()
             try:
-                await self._receive_task
+                await self._connect_task
             except asyncio.CancelledError:
                 pass
-            self._receive_task = None
+        self._connect_task = None
+
+        self._state = _State(0)
+        self.ready.clear()
+
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        del self._pending_audio[:]
+
+        # The tasks may outlive a dropped connection, so clean up regardless
+        # of the connected flag
+        was_open = self._ws is not None
+        await self._close_connection()
+        if was_open:
+            _LOGGER.info("Disconnected from OpenAI Realtime API")
+
+    async def _close_connection(self) -> None:
+        """Stop the receive and dispatch tasks and close the WebSocket."""
+        for task in (self._receive_task, self._dispatch_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._receive_task = None
+        self._dispatch_task = None
 
         if self._ws:
             await self._ws.close()
             self._ws = None
 
-        _LOGGER.info("Disconnected from OpenAI Realtime API")
-
     async def _configure_session(self) -> None:
-        """Configure the session with desired settings."""
+        """Configure the session with desired settings.
+
+        This is the only place session.update is sent. STT and TTS turns
+        share the session as configured here, so per-turn methods such as
+        commit_audio and send_text must not reconfigure it.
+        """
         options = self.config_entry.options
         
+        # Reconnects reuse the serialized config unless the options changed
+        if self._session_payload is None or options != self._session_options:
+            self._session_payload = self._build_session_payload(options)
+            self._session_options = dict(options)
+
+        await self._send_raw(self._session_payload)
+        _LOGGER.info("Session configured")
+
+    def _build_session_payload(self, options: Mapping[str, Any]) -> bytes:
+        """Build the serialized session.update event for the given options."""
         session_config = {
             "type": EVENT_TYPE_SESSION_UPDATE,
             "session": {
                 "type": "realtime",
                 "model": options.get(CONF_MODEL, DEFAULT_MODEL),
-                "output_modalities": ["audio"],
+                "output_modalities": SESSION_OUTPUT_MODALITIES,
                 "audio": {
                     "input": {
                         "format": {"type": "audio/pcm", "rate": AUDIO_SAMPLE_RATE},
@@ -149,187 +325,283 @@ class OpenAIRealtimeClient:
             }
         }
 
-        await self._send_event(session_config)
-        _LOGGER.debug("Session configured")
+        _LOGGER.debug("Session config: %s", session_config)
+        return orjson.dumps(session_config)
 
-    async def _send_event(self, event: dict[str, Any]) -> None:
-        """Send an event to the WebSocket."""
+    async def _send_raw(self, payload: bytes) -> None:
+        """Send an already serialized event to the WebSocket."""
         if not self._ws:
             _LOGGER.error("WebSocket not connected")
             return
 
         try:
-            event_json = json.dumps(event)
-            await self._ws.send(event_json)
-            _LOGGER.debug("Sent event: %s", event.get("type"))
-            if event.get("type") == EVENT_TYPE_SESSION_UPDATE:
-                _LOGGER.debug("Session config: %s", event_json)
+            # The API expects text frames; the payload is already UTF-8 JSON
+            await self._ws.send(payload, text=True)
         except Exception as err:
             _LOGGER.error("Error sending event: %s", err)
 
     async def _receive_messages(self) -> None:
-        """Receive and process messages from WebSocket."""
+        """Receive messages from WebSocket and queue them for handling."""
         if not self._ws:
             return
 
+        # Bind per-message lookups once for the lifetime of the connection
+        markers = self._event_markers
+        put = self._msg_queue.put
         try:
             async for message in self._ws:
-                await self._handle_message(message)
+                if any(marker in message for marker in markers):
+                    await put(message)
         except asyncio.CancelledError:
             _LOGGER.debug("Receive task cancelled")
         except Exception as err:
             _LOGGER.error("Error receiving messages: %s", err)
-            self._connected = False
+        finally:
+            # A clean close from the server ends the loop without raising;
+            # either way the session is gone and the next request reconnects
+            self._state &= ~_State.CONNECTED
+            self.ready.clear()
+
+    async def _dispatch_messages(self) -> None:
+        """Handle queued messages in order."""
+        get = self._msg_queue.get
+        handle = self._handle_message
+        try:
+            while True:
+                await handle(await get())
+        except asyncio.CancelledError:
+            _LOGGER.debug("Dispatch task cancelled")
+
+    def _drop_queued_audio(self) -> None:
+        """Drop audio deltas that were received but not yet handled."""
+        kept: list[str] = []
+        while not self._msg_queue.empty():
+            message = self._msg_queue.get_nowait()
+            if _AUDIO_DELTA_MARKER not in message:
+                kept.append(message)
+        for message in kept:
+            self._msg_queue.put_nowait(message)
 
     async def _handle_message(self, message: str) -> None:
         """Handle incoming WebSocket message."""
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             event_type = data.get("type")
             
-            _LOGGER.debug("Received event: %s - %s", event_type, data.keys())
-
-            if event_type == EVENT_RESPONSE_CREATED:
-                # Track that we have an active response
-                self._has_active_response = True
-                _LOGGER.info("Response created, tracking active response")
-
-            elif event_type == EVENT_TYPE_RESPONSE_AUDIO_DELTA:
-                # Audio chunk received from AI
-                _LOGGER.debug("Audio delta event: %s", data.keys())
-                audio_b64 = data.get("delta")
-                if audio_b64:
-                    _LOGGER.debug("Audio delta size: %d bytes (base64)", len(audio_b64))
-                    if self._audio_callback:
-                        audio_bytes = base64.b64decode(audio_b64)
-                        _LOGGER.debug("Decoded audio size: %d bytes", len(audio_bytes))
-                        self._audio_callback(audio_bytes)
-                else:
-                    _LOGGER.warning("No audio delta in event: %s", data)
-
-            elif event_type == EVENT_TYPE_RESPONSE_AUDIO_TRANSCRIPT_DELTA:
-                # Transcript chunk received
-                transcript = data.get("delta", "")
-                if transcript and self._transcript_callback:
-                    self._transcript_callback(transcript)
-
-            elif event_type == EVENT_TYPE_RESPONSE_DONE:
-                # Response completed
-                self._has_active_response = False
-                _LOGGER.debug("Response done, no longer active")
-                if self._response_done_callback:
-                    self._response_done_callback()
-
-            elif event_type == EVENT_TYPE_INPUT_AUDIO_BUFFER_SPEECH_STARTED:
-                # User started speaking - interrupt AI only if there's an active response
-                _LOGGER.debug("User started speaking")
-                self._is_speaking = True
-                if self._speech_started_callback:
-                    self._speech_started_callback()
-                if self._has_active_response:
-                    _LOGGER.debug("Cancelling active response")
-                    await self.cancel_response()
-
-            elif event_type == EVENT_TYPE_INPUT_AUDIO_BUFFER_SPEECH_STOPPED:
-                # User stopped speaking
-                _LOGGER.debug("User stopped speaking")
-                self._is_speaking = False
-                if self._speech_stopped_callback:
-                    self._speech_stopped_callback()
-
-            elif event_type == "error":
-                error = data.get("error", {})
-                error_code = error.get("code")
-                
-                # Don't log certain expected errors as errors
-                if error_code in ("response_cancel_not_active", "conversation_already_has_active_response"):
-                    _LOGGER.debug("OpenAI API notice: %s", error.get("message"))
-                else:
-                    _LOGGER.error("OpenAI API error: %s", error)
-
-        except json.JSONDecodeError as err:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received event: %s", event_type)
+
+            handler = self._handlers.get(event_type)
+            if handler:
+                await handler(data)
+
+        except orjson.JSONDecodeError as err:
             _LOGGER.error("Failed to decode message: %s", err)
         except Exception as err:
             _LOGGER.error("Error handling message: %s", err)
 
-    async def send_audio(self, audio_data: bytes) -> None:
-        """Send audio data to OpenAI."""
-        if not self._connected or not self._ws:
-            _LOGGER.warning("Cannot send audio: not connected")
+    async def _on_audio_delta(self, data: dict[str, Any]) -> None:
+        """Handle an audio chunk received from the AI."""
+        # Nobody is listening, so don't bother decoding the payload
+        listeners = self._audio_listeners
+        if not listeners:
             return
 
-        # Encode audio as base64
-        audio_b64 = base64.b64encode(audio_data).decode("utf-8")
+        audio_b64 = data.get("delta")
+        if not audio_b64:
+            _LOGGER.warning("No audio delta in event: %s", data)
+            return
 
-        event = {
-            "type": EVENT_TYPE_INPUT_AUDIO_BUFFER_APPEND,
-            "audio": audio_b64,
-        }
+        if len(audio_b64) >= AUDIO_EXECUTOR_THRESHOLD:
+            # Decode off the loop, but call back on it
+            audio = await self.hass.async_add_executor_job(
+                base64.b64decode, audio_b64
+            )
+        else:
+            audio = base64.b64decode(audio_b64)
+        for listener in listeners:
+            listener(audio)
+
+    async def _on_transcript_delta(self, data: dict[str, Any]) -> None:
+        """Handle a transcript chunk."""
+        transcript = data.get("delta", "")
+        if transcript:
+            for listener in self._transcript_listeners:
+                listener(transcript)
+
+    async def _on_response_created(self, data: dict[str, Any]) -> None:
+        """Track that we have an active response."""
+        self._state |= _State.ACTIVE_RESPONSE
+        _LOGGER.info("Response created, tracking active response")
+
+    async def _on_response_done(self, data: dict[str, Any]) -> None:
+        """Handle response completion."""
+        self._state &= ~_State.ACTIVE_RESPONSE
+        _LOGGER.debug("Response done, no longer active")
+        for listener in self._response_done_listeners:
+            listener()
+
+    async def _on_speech_started(self, data: dict[str, Any]) -> None:
+        """Handle user speech start, interrupting the AI if it is responding."""
+        _LOGGER.debug("User started speaking")
+        self._state |= _State.SPEAKING
+        if self._speech_started_callback:
+            self._speech_started_callback()
+        if self._state & _State.ACTIVE_RESPONSE:
+            _LOGGER.debug("Cancelling active response")
+            await self.cancel_response()
+
+    async def _on_speech_stopped(self, data: dict[str, Any]) -> None:
+        """Handle user speech stop."""
+        _LOGGER.debug("User stopped speaking")
+        self._state &= ~_State.SPEAKING
+        if self._speech_stopped_callback:
+            self._speech_stopped_callback()
+
+    async def _on_error(self, data: dict[str, Any]) -> None:
+        """Handle an error event."""
+        error = data.get("error", {})
+        error_code = error.get("code")
+        
+        # Don't log certain expected errors as errors
+        if error_code in ("response_cancel_not_active", "conversation_already_has_active_response"):
+            _LOGGER.debug("OpenAI API notice: %s", error.get("message"))
+        else:
+            _LOGGER.error("OpenAI API error: %s", error)
+
+    async def send_audio(self, audio_data: bytes) -> None:
+        """Queue audio data to be sent to OpenAI.
+
+        Chunks are coalesced and flushed as one append event every
+        AUDIO_SEND_INTERVAL seconds to limit the number of WebSocket frames.
+        """
+        if not self._state & _State.CONNECTED or not self._ws:
+            _LOGGER.warning("Cannot send audio: not connected")
+            return
 
-        await self._send_event(event)
+        self._pending_audio.extend(audio_data)
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                AUDIO_SEND_INTERVAL,
+                lambda: self.hass.async_create_task(self._flush_audio()),
+            )
+
+    async def _flush_audio(self) -> None:
+        """Send all pending audio in a single append event."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._flush_lock:
+            if not self._pending_audio:
+                return
+
+            # Base64 output is JSON-safe, so it can be spliced in as-is
+            if len(self._pending_audio) >= AUDIO_EXECUTOR_THRESHOLD:
+                audio = bytes(self._pending_audio)
+                del self._pending_audio[:]
+                audio_b64 = await self.hass.async_add_executor_job(
+                    base64.b64encode, audio
+                )
+            else:
+                audio_b64 = base64.b64encode(self._pending_audio)
+                del self._pending_audio[:]
+            await self._send_raw(
+                _AUDIO_APPEND_PREFIX + audio_b64 + _AUDIO_APPEND_SUFFIX
+            )
 
     async def commit_audio(self) -> None:
         """Commit audio buffer and request response."""
-        if not self._connected:
+        if not self._state & _State.CONNECTED:
             return
 
+        # Flush coalesced audio so the commit covers everything sent so far
+        await self._flush_audio()
+
         # Commit the audio buffer
-        await self._send_event({"type": EVENT_TYPE_INPUT_AUDIO_BUFFER_COMMIT})
+        await self._send_raw(_MSG_COMMIT)
         
         # Request a response only if we don't already have one active
-        # Voice and audio format are already configured in the session
-        if not self._has_active_response:
-            await self._send_event({"type": EVENT_TYPE_RESPONSE_CREATE})
-            self._has_active_response = True
+        # Voice, audio format and modalities are already set for the session
+        if not self._state & _State.ACTIVE_RESPONSE:
+            await self._send_raw(_MSG_RESPONSE_CREATE)
+            self._state |= _State.ACTIVE_RESPONSE
 
     async def cancel_response(self) -> None:
         """Cancel the current AI response (for interruption)."""
-        if not self._connected:
+        if not self._state & _State.CONNECTED:
             return
 
-        # Only cancel if we actually have an active response
-        if self._has_active_response:
-            await self._send_event({"type": EVENT_TYPE_RESPONSE_CANCEL})
-            self._has_active_response = False
-        
-        # Clear input audio buffer
-        await self._send_event({"type": EVENT_TYPE_INPUT_AUDIO_BUFFER_CLEAR})
+        # Only cancel if we actually have an active response, then always
+        # clear the input audio buffer
+        payloads = [_MSG_CLEAR]
+        if self._state & _State.ACTIVE_RESPONSE:
+            payloads.insert(0, _MSG_CANCEL)
+            self._state &= ~_State.ACTIVE_RESPONSE
+
+        # Stale audio from the interrupted response should not be played
+        self._drop_queued_audio()
+
+        # Issue both writes back-to-back rather than waiting on each in turn
+        await asyncio.gather(*(self._send_raw(payload) for payload in payloads))
+
+    async def async_cancel_and_wait(self, timeout: float) -> None:
+        """Cancel the active response and wait for the server to end it.
+
+        A cancelled response still gets a response.done, which would complete
+        the next request; call this before releasing request_lock.
+        """
+        if not self._state & _State.ACTIVE_RESPONSE:
+            await self.cancel_response()
+            return
+
+        done = asyncio.Event()
+        remove_listener = self.add_response_done_listener(done.set)
+        try:
+            await self.cancel_response()
+            async with asyncio.timeout(timeout):
+                await done.wait()
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Cancelled response did not end in time")
+        finally:
+            remove_listener()
 
     async def send_text(self, text: str) -> None:
         """Send text message to the conversation."""
-        if not self._connected:
+        if not self._state & _State.CONNECTED:
             _LOGGER.warning("Cannot send text: not connected")
             return
 
-        event = {
-            "type": EVENT_TYPE_CONVERSATION_ITEM_CREATE,
-            "item": {
-                "type": "message",
-                "role": "user",
-                "content": [{"type": "input_text", "text": text}],
-            }, 
-        }
-
-        await self._send_event(event)
+        # Only the text needs escaping; the rest of the event is constant
+        await self._send_raw(_TEXT_ITEM_PREFIX + orjson.dumps(text) + _TEXT_ITEM_SUFFIX)
         
         # Request a response only if we don't already have one active
-        # Voice and audio format are already configured in the session
-        if not self._has_active_response:
-            await self._send_event({"type": EVENT_TYPE_RESPONSE_CREATE})
-            self._has_active_response = True
-            self._has_active_response = True
-
-    def set_audio_callback(self, callback: Callable[[bytes], None]) -> None:
-        """Set callback for received audio."""
-        self._audio_callback = callback
-
-    def set_transcript_callback(self, callback: Callable[[str], None]) -> None:
-        """Set callback for received transcript."""
-        self._transcript_callback = callback
-
-    def set_response_done_callback(self, callback: Callable[[], None]) -> None:
-        """Set callback for response completion."""
-        self._response_done_callback = callback
+        # Voice, audio format and modalities are already set for the session
+        if not self._state & _State.ACTIVE_RESPONSE:
+            await self._send_raw(_MSG_RESPONSE_CREATE)
+            self._state |= _State.ACTIVE_RESPONSE
+
+    def add_audio_listener(self, listener: Callable[[bytes], None]) -> CALLBACK_TYPE:
+        """Add a listener for received audio, return a function to remove it."""
+        return self._add_listener(self._audio_listeners, listener)
+
+    def add_transcript_listener(self, listener: Callable[[str], None]) -> CALLBACK_TYPE:
+        """Add a listener for received transcript, return a function to remove it."""
+        return self._add_listener(self._transcript_listeners, listener)
+
+    def add_response_done_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Add a listener for response completion, return a function to remove it."""
+        return self._add_listener(self._response_done_listeners, listener)
+
+    @staticmethod
+    def _add_listener(listeners: list[Any], listener: Any) -> CALLBACK_TYPE:
+        """Append a listener to a list and return a function to remove it."""
+        listeners.append(listener)
+
+        def remove_listener() -> None:
+            listeners.remove(listener)
+
+        return remove_listener
 
     def set_speech_started_callback(self, callback: Callable[[], None]) -> None:
         """Set callback for when user starts speaking."""
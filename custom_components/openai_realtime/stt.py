@@ -17,13 +17,38 @@ from homeassistant.components.stt import (
     SpeechResultState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-
-from .const import AUDIO_CHANNELS, AUDIO_SAMPLE_RATE, DOMAIN
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    AUDIO_CHANNELS,
+    AUDIO_SAMPLE_RATE,
+    CANCEL_TIMEOUT,
+    CONNECT_TIMEOUT,
+    DOMAIN,
+    RESPONSE_TIMEOUT,
+)
 from .realtime_client import OpenAIRealtimeClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Home Assistant treats these as read-only, so the same lists are returned
+_SUPPORTED_LANGUAGES = ["en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru", "ja", "ko", "zh"]
+_SUPPORTED_FORMATS = [AudioFormats.WAV]
+_SUPPORTED_CODECS = [AudioCodecs.PCM]
+_SUPPORTED_BIT_RATES = [AudioBitRates.BITRATE_16]
+# OpenAI Realtime API uses 24kHz internally, but we accept 16kHz and 22kHz
+# Audio will be resampled if needed
+_SUPPORTED_SAMPLE_RATES = [
+    AudioSampleRates.SAMPLERATE_16000,
+    AudioSampleRates.SAMPLERATE_22000,
+]
+_SUPPORTED_CHANNELS = [AudioChannels.CHANNEL_MONO]
+
+
+def _error_result() -> SpeechResult:
+    """Return the result reported for a failed transcription."""
+    return SpeechResult(text="", result=SpeechResultState.ERROR)
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -36,11 +61,15 @@ async def async_setup_platform(
     if discovery_info is None:
         return
     
-    entry_id = discovery_info.get("entry_id")
-    if not entry_id or entry_id not in hass.data.get(DOMAIN, {}):
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
+        return
+    
+    entry_data = domain_data.get(discovery_info.get("entry_id"))
+    if not entry_data:
         return
     
-    client: OpenAIRealtimeClient = hass.data[DOMAIN][entry_id]["client"]
+    client: OpenAIRealtimeClient = entry_data["client"]
     async_add_entities([OpenAIRealtimeSTTProvider(client)])
 
 
@@ -55,22 +84,28 @@ async def async_get_engine(
     if not entries:
         return None
     
-    entry = entries[0]
-    if entry.entry_id not in hass.data.get(DOMAIN, {}):
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
         return None
     
-    client: OpenAIRealtimeClient = hass.data[DOMAIN][entry.entry_id]["client"]
+    entry_data = domain_data.get(entries[0].entry_id)
+    if not entry_data:
+        return None
+    
+    client: OpenAIRealtimeClient = entry_data["client"]
     return OpenAIRealtimeSTTProvider(client)
 
 
 class OpenAIRealtimeSTTProvider(Provider):
     """OpenAI Realtime speech-to-text provider."""
 
+    # Legacy providers are not entities, so there is no _attr_name; the
+    # setter below keeps this name when discovery assigns the platform name
+    _name = "OpenAI Realtime STT"
+
     def __init__(self, client: OpenAIRealtimeClient) -> None:
         """Initialize the provider."""
         self.client = client
-        self._transcript_queue: asyncio.Queue[str | None] = asyncio.Queue()
-        self._name = "OpenAI Realtime STT"
 
     @property
     def name(self) -> str:
@@ -83,39 +118,36 @@ class OpenAIRealtimeSTTProvider(Provider):
         # Keep our custom name even if HA tries to set it to domain name
         if value and not value.startswith("openai_"):
             self._name = value
-        # Otherwise keep "OpenAI Realtime STT"
 
     @property
     def supported_languages(self) -> list[str]:
         """Return a list of supported languages."""
-        return ["en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru", "ja", "ko", "zh"]
+        return _SUPPORTED_LANGUAGES
 
     @property
     def supported_formats(self) -> list[AudioFormats]:
         """Return a list of supported formats."""
-        return [AudioFormats.WAV]
+        return _SUPPORTED_FORMATS
 
     @property
     def supported_codecs(self) -> list[AudioCodecs]:
         """Return a list of supported codecs."""
-        return [AudioCodecs.PCM]
+        return _SUPPORTED_CODECS
 
     @property
     def supported_bit_rates(self) -> list[AudioBitRates]:
         """Return a list of supported bitrates."""
-        return [AudioBitRates.BITRATE_16]
+        return _SUPPORTED_BIT_RATES
 
     @property
     def supported_sample_rates(self) -> list[AudioSampleRates]:
         """Return a list of supported sample rates."""
-        # OpenAI Realtime API uses 24kHz internally, but we accept 16kHz and 22kHz
-        # Audio will be resampled if needed
-        return [AudioSampleRates.SAMPLERATE_16000, AudioSampleRates.SAMPLERATE_22000]
+        return _SUPPORTED_SAMPLE_RATES
 
     @property
     def supported_channels(self) -> list[AudioChannels]:
         """Return a list of supported channels."""
-        return [AudioChannels.CHANNEL_MONO]
+        return _SUPPORTED_CHANNELS
 
     async def async_process_audio_stream(
         self, metadata: SpeechMetadata, stream: AsyncIterable[bytes]
@@ -126,63 +158,66 @@ class OpenAIRealtimeSTTProvider(Provider):
         # If metadata indicates a different sample rate (16kHz or 22kHz),
         # the API will handle resampling automatically
         
-        # Ensure connected
-        if not self.client.connected:
+        # Only one request may be in flight on the shared session at a time
+        async with self.client.request_lock:
+            # The session is normally already open since setup. Check it only
+            # now: it may have dropped while this request waited for the lock
             try:
-                await self.client.connect()
+                await self.client.async_wait_ready(CONNECT_TIMEOUT)
             except Exception as err:
                 _LOGGER.error("Failed to connect to OpenAI: %s", err)
-                return SpeechResult(
-                    text="",
-                    result=SpeechResultState.ERROR,
-                )
+                return _error_result()
 
-        # Set up transcript callback
-        transcript_parts = []
+            return await self._async_transcribe(stream)
+
+    async def _async_transcribe(self, stream: AsyncIterable[bytes]) -> SpeechResult:
+        """Send an audio stream and collect the transcript of its response."""
+        # Set up transcript listeners for this request only
+        transcript_parts: list[str] = []
+        response_done = asyncio.Event()
         
+        @callback
         def transcript_callback(text: str) -> None:
             transcript_parts.append(text)
-            self._transcript_queue.put_nowait(text)
         
+        @callback
         def response_done_callback() -> None:
-            self._transcript_queue.put_nowait(None)  # Signal completion
+            response_done.set()
         
-        self.client.set_transcript_callback(transcript_callback)
-        self.client.set_response_done_callback(response_done_callback)
+        remove_transcript_listener = self.client.add_transcript_listener(
+            transcript_callback
+        )
+        remove_response_done_listener = self.client.add_response_done_listener(
+            response_done_callback
+        )
 
         try:
-            # Stream audio to OpenAI
-            async for chunk in stream:
-                if chunk:
+            # Stream audio to OpenAI, then commit the buffer to trigger processing
+            try:
+                # send_audio only buffers; the client flushes to the socket on
+                # a timer, so reading the stream never waits on a write.
+                # Empty chunks add nothing, and empty flushes are skipped.
+                async for chunk in stream:
                     await self.client.send_audio(chunk)
-            
-            # Commit audio buffer to trigger processing
-            await self.client.commit_audio()
-            
+                await self.client.commit_audio()
+            except Exception as err:
+                _LOGGER.error("Error processing audio: %s", err)
+                return _error_result()
+
             # Wait for transcript completion
-            while True:
-                text = await asyncio.wait_for(
-                    self._transcript_queue.get(), timeout=30.0
-                )
-                if text is None:  # Done signal
-                    break
-            
-            full_transcript = "".join(transcript_parts)
-            
-            return SpeechResult(
-                text=full_transcript,
-                result=SpeechResultState.SUCCESS,
-            )
-
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout waiting for transcription")
-            return SpeechResult(
-                text="",
-                result=SpeechResultState.ERROR,
-            )
-        except Exception as err:
-            _LOGGER.error("Error processing audio: %s", err)
-            return SpeechResult(
-                text="",
-                result=SpeechResultState.ERROR,
-            )
+            try:
+                async with asyncio.timeout(RESPONSE_TIMEOUT):
+                    await response_done.wait()
+            except asyncio.TimeoutError:
+                _LOGGER.error("Timeout waiting for transcription")
+                # Don't let the late response leak into the next request
+                await self.client.async_cancel_and_wait(CANCEL_TIMEOUT)
+                return _error_result()
+        finally:
+            remove_transcript_listener()
+            remove_response_done_listener()
+
+        return SpeechResult(
+            text="".join(transcript_parts),
+            result=SpeechResultState.SUCCESS,
+        )
@@ -2,19 +2,70 @@
 from __future__ import annotations
 
 import asyncio
-import io
+from collections.abc import AsyncGenerator
 import logging
-import wave
+import struct
 
 from homeassistant.components.tts import Provider, Voice, TtsAudioType
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
-from .const import AUDIO_CHANNELS, AUDIO_SAMPLE_RATE, DOMAIN
+from .const import (
+    AUDIO_CHANNELS,
+    AUDIO_SAMPLE_RATE,
+    AUDIO_SAMPLE_WIDTH,
+    CANCEL_TIMEOUT,
+    CONNECT_TIMEOUT,
+    DOMAIN,
+    RESPONSE_QUEUE_SIZE,
+    RESPONSE_QUEUE_WARN_SIZE,
+    RESPONSE_TIMEOUT,
+)
+from .exceptions import AudioStreamError
 from .realtime_client import OpenAIRealtimeClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Home Assistant treats these as read-only, so the same lists are returned
+_SUPPORTED_LANGUAGES = ["en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru", "ja", "ko", "zh"]
+_SUPPORTED_OPTIONS = ["voice"]
+_SUPPORTED_VOICES = [
+    Voice("alloy", "Alloy"),
+    Voice("echo", "Echo"),
+    Voice("shimmer", "Shimmer"),
+]
+
+# The audio format is fixed, so the whole fmt chunk is computed at import
+_BLOCK_ALIGN = AUDIO_CHANNELS * AUDIO_SAMPLE_WIDTH
+_BYTE_RATE = AUDIO_SAMPLE_RATE * _BLOCK_ALIGN
+
+# 44-byte PCM16 WAV header; the RIFF and data sizes are patched per response
+_WAV_HEADER = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF",
+    0,
+    b"WAVE",
+    b"fmt ",
+    16,  # fmt chunk size
+    1,  # PCM
+    AUDIO_CHANNELS,
+    AUDIO_SAMPLE_RATE,
+    _BYTE_RATE,
+    _BLOCK_ALIGN,
+    AUDIO_SAMPLE_WIDTH * 8,  # bits per sample
+    b"data",
+    0,
+)
+_WAV_HEADER_SIZE = len(_WAV_HEADER)
+_WAV_SIZE_FIELD = struct.Struct("<I")
+
+
+def _set_wav_sizes(wav: bytearray) -> None:
+    """Fill in the sizes of a WAV buffer that starts with _WAV_HEADER."""
+    data_size = len(wav) - _WAV_HEADER_SIZE
+    _WAV_SIZE_FIELD.pack_into(wav, 4, _WAV_HEADER_SIZE - 8 + data_size)
+    _WAV_SIZE_FIELD.pack_into(wav, 40, data_size)
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -27,11 +78,15 @@ async def async_setup_platform(
     if discovery_info is None:
         return
     
-    entry_id = discovery_info.get("entry_id")
-    if not entry_id or entry_id not in hass.data.get(DOMAIN, {}):
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
         return
     
-    client: OpenAIRealtimeClient = hass.data[DOMAIN][entry_id]["client"]
+    entry_data = domain_data.get(discovery_info.get("entry_id"))
+    if not entry_data:
+        return
+    
+    client: OpenAIRealtimeClient = entry_data["client"]
     async_add_entities([OpenAIRealtimeTTSProvider(hass, client)])
 
 
@@ -46,23 +101,29 @@ async def async_get_engine(
     if not entries:
         return None
     
-    entry = entries[0]
-    if entry.entry_id not in hass.data.get(DOMAIN, {}):
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
+        return None
+    
+    entry_data = domain_data.get(entries[0].entry_id)
+    if not entry_data:
         return None
     
-    client: OpenAIRealtimeClient = hass.data[DOMAIN][entry.entry_id]["client"]
+    client: OpenAIRealtimeClient = entry_data["client"]
     return OpenAIRealtimeTTSProvider(hass, client)
 
 
 class OpenAIRealtimeTTSProvider(Provider):
     """OpenAI Realtime text-to-speech provider."""
 
+    # Legacy providers are not entities, so there is no _attr_name; the
+    # setter below keeps this name when discovery assigns the platform name
+    _name = "OpenAI Realtime TTS"
+
     def __init__(self, hass: HomeAssistant, client: OpenAIRealtimeClient) -> None:
         """Initialize the provider."""
         self.hass = hass
         self.client = client
-        self._audio_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
-        self._name = "OpenAI Realtime TTS"
 
     @property
     def name(self) -> str:
@@ -75,12 +136,11 @@ class OpenAIRealtimeTTSProvider(Provider):
         # Keep our custom name even if HA tries to set it to domain name
         if value and not value.startswith("openai_"):
             self._name = value
-        # Otherwise keep "OpenAI Realtime TTS"
 
     @property
     def supported_languages(self) -> list[str]:
         """Return a list of supported languages."""
-        return ["en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru", "ja", "ko", "zh"]
+        return _SUPPORTED_LANGUAGES
 
     @property
     def default_language(self) -> str:
@@ -90,91 +150,107 @@ class OpenAIRealtimeTTSProvider(Provider):
     @property
     def supported_options(self) -> list[str]:
         """Return a list of supported options."""
-        return ["voice"]
+        return _SUPPORTED_OPTIONS
 
     async def async_get_supported_voices(self, language: str) -> list[Voice]:
         """Return a list of supported voices for a language."""
-        return [
-            Voice("alloy", "Alloy"),
-            Voice("echo", "Echo"),
-            Voice("shimmer", "Shimmer"),
-        ]
-
-    def _create_wav_header(self, data_size: int) -> bytes:
-        """Create WAV file header."""
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(AUDIO_CHANNELS)
-            wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-            wav_file.setframerate(AUDIO_SAMPLE_RATE)
-            wav_file.writeframes(b"\x00" * data_size)
-        
-        return wav_buffer.getvalue()
+        return _SUPPORTED_VOICES
 
     async def async_get_tts_audio(
         self, message: str, language: str, options: dict | None = None
     ) -> TtsAudioType:
         """Convert text to speech."""
         
-        # Ensure connected
-        if not self.client.connected:
+        # Audio is appended right after the header so the WAV needs no copy
+        wav_buffer = bytearray(_WAV_HEADER)
+
+        # Only one request may be in flight on the shared session at a time
+        async with self.client.request_lock:
+            # The session is normally already open since setup. Check it only
+            # now: it may have dropped while this request waited for the lock
             try:
-                await self.client.connect()
+                await self.client.async_wait_ready(CONNECT_TIMEOUT)
             except Exception as err:
                 _LOGGER.error("Failed to connect to OpenAI: %s", err)
                 return None, None
 
-        # Set up audio callback
-        audio_chunks = []
+            try:
+                async with asyncio.timeout(RESPONSE_TIMEOUT):
+                    async for chunk in self._async_stream_audio(message):
+                        wav_buffer.extend(chunk)
+            except asyncio.TimeoutError:
+                _LOGGER.error("Timeout waiting for audio")
+                # Don't let the late response leak into the next request
+                await self.client.async_cancel_and_wait(CANCEL_TIMEOUT)
+                return None, None
+            except AudioStreamError as err:
+                _LOGGER.error("Error receiving audio: %s", err)
+                await self.client.async_cancel_and_wait(CANCEL_TIMEOUT)
+                return None, None
+            except Exception as err:
+                _LOGGER.error("Error generating speech: %s", err)
+                return None, None
+
+        data_size = len(wav_buffer) - _WAV_HEADER_SIZE
+        _LOGGER.info("TTS: Collected %d bytes of audio", data_size)
+        
+        if not data_size:
+            _LOGGER.error("No audio data received")
+            return None, None
+        
+        _set_wav_sizes(wav_buffer)
+        return "wav", bytes(wav_buffer)
+
+    async def _async_stream_audio(self, message: str) -> AsyncGenerator[bytes, None]:
+        """Send a text message and yield its PCM audio chunks as they arrive."""
+        # Set up audio listeners for this request only
+        audio_queue: asyncio.Queue[bytes | None] = asyncio.Queue(
+            maxsize=RESPONSE_QUEUE_SIZE
+        )
+        
+        overflowed = False
+
+        def put(item: bytes | None) -> None:
+            nonlocal overflowed
+            if overflowed:
+                return
+            if audio_queue.qsize() == RESPONSE_QUEUE_WARN_SIZE:
+                _LOGGER.warning("TTS: Audio queue is filling up")
+            try:
+                audio_queue.put_nowait(item)
+            except asyncio.QueueFull:
+                # The WAV is only returned once complete, so a dropped chunk
+                # would leave a gap in it; fail the request instead
+                overflowed = True
+                while not audio_queue.empty():
+                    audio_queue.get_nowait()
+                audio_queue.put_nowait(None)
         
+        @callback
         def audio_callback(audio_data: bytes) -> None:
-            _LOGGER.debug("TTS: Received audio chunk of %d bytes", len(audio_data))
-            audio_chunks.append(audio_data)
-            self._audio_queue.put_nowait(audio_data)
+            put(audio_data)
         
+        @callback
         def response_done_callback() -> None:
-            _LOGGER.info("TTS: Response complete, collected %d chunks", len(audio_chunks))
-            self._audio_queue.put_nowait(None)  # Signal completion
+            _LOGGER.info("TTS: Response complete")
+            put(None)  # Signal completion
         
-        self.client.set_audio_callback(audio_callback)
-        self.client.set_response_done_callback(response_done_callback)
+        remove_audio_listener = self.client.add_audio_listener(audio_callback)
+        remove_response_done_listener = self.client.add_response_done_listener(
+            response_done_callback
+        )
 
         try:
             # Send text message
             _LOGGER.info("TTS: Sending text message: %s", message)
             await self.client.send_text(message)
             
-            # Collect audio chunks
             _LOGGER.debug("TTS: Waiting for audio chunks...")
-            while True:
-                chunk = await asyncio.wait_for(
-                    self._audio_queue.get(), timeout=30.0
-                )
-                if chunk is None:  # Done signal
-                    _LOGGER.debug("TTS: Received completion signal")
-                    break
-            
-            # Combine all audio chunks
-            full_audio = b"".join(audio_chunks)
-            _LOGGER.info("TTS: Collected %d bytes of audio", len(full_audio))
-            
-            if not full_audio:
-                _LOGGER.error("No audio data received")
-                return None, None
-            
-            # Create WAV file
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, "wb") as wav_file:
-                wav_file.setnchannels(AUDIO_CHANNELS)
-                wav_file.setsampwidth(2)  # 16-bit PCM
-                wav_file.setframerate(AUDIO_SAMPLE_RATE)
-                wav_file.writeframes(full_audio)
-            
-            return "wav", wav_buffer.getvalue()
-
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout waiting for audio")
-            return None, None
-        except Exception as err:
-            _LOGGER.error("Error generating speech: %s", err)
-            return None, None
+            while (chunk := await audio_queue.get()) is not None:
+                yield chunk
+            if overflowed:
+                raise AudioStreamError("Audio queue overflowed")
+            _LOGGER.debug("TTS: Received completion signal")
+        finally:
+            remove_audio_listener()
+            remove_response_done_listener()